@@ -1,7 +1,33 @@
-from typing import Optional, Any
+from contextlib import asynccontextmanager
+from functools import wraps
+from threading import RLock
+from typing import Optional, Any, AsyncIterator, Awaitable, Callable, Dict, Tuple, TypeVar, cast
 
 from phi.utils.log import logger
 
+# boto3 sessions shared by all AwsApiClients, keyed by (aws_region, aws_profile).
+# A session resolves credentials once and caches them, refreshing temporary credentials only
+# when they are about to expire. Sharing it means the credential chain (and with it the
+# instance metadata endpoint on EC2/ECS) is not walked again for every AwsApiClient.
+_boto3_sessions: Dict[Tuple[Optional[str], Optional[str]], Any] = {}
+# boto3 sessions are not thread-safe, guards session and client creation
+_boto3_session_lock = RLock()
+# aiobotocore sessions shared by all AwsApiClients, keyed by (aws_region, aws_profile), like the boto3 sessions.
+# Each one resolves and refreshes its own credentials, without blocking the event loop.
+_aio_sessions: Dict[Tuple[Optional[str], Optional[str]], Any] = {}
+# botocore.config.Config arguments for clients of specific services
+_service_client_configs: Dict[str, Dict[str, Any]] = {
+    # DescribeServices/CreateService/UpdateService are throttled when many services are managed at once.
+    # Adaptive retries back off and rate limit client-side when throttled, and the larger pool
+    # lets EcsService.apply_many workers share the client without waiting for a connection.
+    "ecs": {
+        "retries": {"mode": "adaptive", "max_attempts": 10},
+        "connect_timeout": 5,
+        "read_timeout": 30,
+        "max_pool_connections": 50,
+    },
+}
+
 
 class AwsApiClient:
     def __init__(
@@ -15,25 +41,34 @@ class AwsApiClient:
 
         # aws boto3 session
         self._boto3_session: Optional[Any] = None
+        # boto3 clients created from the session, shared by all resources using this AwsApiClient
+        self._service_clients: Dict[str, Any] = {}
         logger.debug("**-+-** AwsApiClient created")
 
     def create_boto3_session(self) -> Optional[Any]:
         """Create a boto3 session"""
         import boto3
 
-        logger.debug("Creating boto3.Session")
-        try:
-            self._boto3_session = boto3.Session(
-                region_name=self.aws_region,
-                profile_name=self.aws_profile,
-            )
-            logger.debug("**-+-** boto3.Session created")
-            logger.debug(f"\taws_region: {self._boto3_session.region_name}")
-            logger.debug(f"\taws_profile: {self._boto3_session.profile_name}")
-        except Exception as e:
-            logger.error("Could not connect to aws. Please confirm aws cli is installed and configured")
-            logger.error(e)
-            exit(0)
+        session_key = (self.aws_region, self.aws_profile)
+        with _boto3_session_lock:
+            if session_key in _boto3_sessions:
+                self._boto3_session = _boto3_sessions[session_key]
+                return self._boto3_session
+
+            logger.debug("Creating boto3.Session")
+            try:
+                self._boto3_session = boto3.Session(
+                    region_name=self.aws_region,
+                    profile_name=self.aws_profile,
+                )
+                logger.debug("**-+-** boto3.Session created")
+                logger.debug(f"\taws_region: {self._boto3_session.region_name}")
+                logger.debug(f"\taws_profile: {self._boto3_session.profile_name}")
+            except Exception as e:
+                logger.error("Could not connect to aws. Please confirm aws cli is installed and configured")
+                logger.error(e)
+                exit(0)
+            _boto3_sessions[session_key] = self._boto3_session
         return self._boto3_session
 
     @property
@@ -41,3 +76,88 @@ class AwsApiClient:
         if self._boto3_session is None:
             self._boto3_session = self.create_boto3_session()
         return self._boto3_session
+
+    def get_service_client(self, service_name: str) -> Any:
+        """Returns the boto3 client for a service, creating it on first use.
+
+        Building a client loads the service model and resolves endpoints, so it is done once per
+        AwsApiClient. boto3 clients are thread-safe but creating them from a shared session is not,
+        hence the lock.
+        """
+        with _boto3_session_lock:
+            if service_name not in self._service_clients:
+                logger.debug(f"Creating boto3 client for {service_name}")
+                boto3_session: Any = self.boto3_session
+                client_config: Optional[Any] = None
+                if service_name in _service_client_configs:
+                    from botocore.config import Config
+
+                    client_config = Config(**_service_client_configs[service_name])
+                self._service_clients[service_name] = boto3_session.client(
+                    service_name=service_name, config=client_config
+                )
+            return self._service_clients[service_name]
+
+    def get_service_resource(self, service_name: str) -> Any:
+        """Returns a new boto3 resource for a service.
+
+        Unlike clients, boto3 resources are not thread-safe, so they are not shared between callers.
+        They are still created from the shared session, hence the lock.
+        """
+        with _boto3_session_lock:
+            logger.debug(f"Creating boto3 resource for {service_name}")
+            boto3_session: Any = self.boto3_session
+            return boto3_session.resource(service_name=service_name)
+
+    @asynccontextmanager
+    async def get_async_service_client(self, service_name: str) -> AsyncIterator[Any]:
+        """Yields an aiobotocore client for a service and closes it on exit.
+
+        aiobotocore clients are bound to the event loop they are used in, so a client is opened per call.
+        The aiobotocore session is shared per region and profile. It resolves credentials once and refreshes
+        temporary credentials before they expire, so long running calls like apply_many_async keep working.
+        """
+        try:
+            from aiobotocore.config import AioConfig
+            from aiobotocore.session import get_session
+        except ImportError:
+            raise ImportError("`aiobotocore` not installed. Please install using `pip install aiobotocore`")
+
+        session_key = (self.aws_region, self.aws_profile)
+        with _boto3_session_lock:
+            if session_key not in _aio_sessions:
+                logger.debug("Creating aiobotocore session")
+                aio_session = get_session()
+                if self.aws_profile is not None:
+                    aio_session.set_config_variable("profile", self.aws_profile)
+                if self.aws_region is not None:
+                    aio_session.set_config_variable("region", self.aws_region)
+                _aio_sessions[session_key] = aio_session
+            aio_session = _aio_sessions[session_key]
+
+        client_config: Optional[Any] = None
+        if service_name in _service_client_configs:
+            client_config = AioConfig(**_service_client_configs[service_name])
+        async with aio_session.create_client(
+            service_name, region_name=self.aws_region, config=client_config
+        ) as service_client:
+            yield service_client
+
+
+AsyncMethod = TypeVar("AsyncMethod", bound=Callable[..., Awaitable[Any]])
+
+
+def with_async_service_client(func: AsyncMethod) -> AsyncMethod:
+    """Opens an aiobotocore client for a resource method if the caller does not provide one
+
+    The decorated method is called as method(self, aws_client, service_client), where self is an AwsResource.
+    """
+
+    @wraps(func)
+    async def wrapper(self: Any, aws_client: AwsApiClient, service_client: Any = None) -> Any:
+        if service_client is not None:
+            return await func(self, aws_client, service_client)
+        async with aws_client.get_async_service_client(self.service_name) as _service_client:
+            return await func(self, aws_client, _service_client)
+
+    return cast(AsyncMethod, wrapper)
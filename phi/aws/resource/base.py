@@ -3,6 +3,7 @@ from typing import Any, Optional
 from phi.resource.base import ResourceBase
 from phi.aws.api_client import AwsApiClient
 from phi.cli.console import print_info
+from phi.utils.concurrency import run_in_thread
 from phi.utils.log import logger
 
 
@@ -16,6 +17,9 @@ class AwsResource(ResourceBase):
 
     aws_client: Optional[AwsApiClient] = None
 
+    # Set by _update if the resource already matched the desired state, so no change was made
+    resource_up_to_date: bool = False
+
     def get_aws_region(self) -> Optional[str]:
         # Priority 1: Use aws_region from resource
         if self.aws_region:
@@ -57,19 +61,13 @@ class AwsResource(ResourceBase):
         return self.aws_profile
 
     def get_service_client(self, aws_client: AwsApiClient):
-        from boto3 import session
-
         if self.service_client is None:
-            boto3_session: session = aws_client.boto3_session
-            self.service_client = boto3_session.client(service_name=self.service_name)
+            self.service_client = aws_client.get_service_client(self.service_name)
         return self.service_client
 
     def get_service_resource(self, aws_client: AwsApiClient):
-        from boto3 import session
-
         if self.service_resource is None:
-            boto3_session: session = aws_client.boto3_session
-            self.service_resource = boto3_session.resource(service_name=self.service_name)
+            self.service_resource = aws_client.get_service_resource(self.service_name)
         return self.service_resource
 
     def get_aws_client(self) -> AwsApiClient:
@@ -78,10 +76,30 @@ class AwsResource(ResourceBase):
         self.aws_client = AwsApiClient(aws_region=self.get_aws_region(), aws_profile=self.get_aws_profile())
         return self.aws_client
 
+    def show_progress(self) -> bool:
+        """Returns False if progress messages for this resource are turned off"""
+        return True
+
+    def skip_action(self, action: str) -> bool:
+        """Returns True, after printing a message, if skip_<action> = True"""
+        if not getattr(self, f"skip_{action}", False):
+            return False
+        if self.show_progress():
+            print_info(f"Skipping {action}: {self.get_resource_name()}")
+        return True
+
+    def print_not_found(self) -> None:
+        if self.show_progress():
+            print_info(f"{self.get_resource_type()}: {self.get_resource_name()} does not exist")
+
     def _read(self, aws_client: AwsApiClient) -> Any:
         logger.warning(f"@_read method not defined for {self.get_resource_name()}")
         return True
 
+    async def _aread(self, aws_client: AwsApiClient, service_client: Any = None) -> Any:
+        """Reads the resource without blocking the event loop, runs _read in a thread unless overridden"""
+        return await run_in_thread(self._read, aws_client)
+
     def read(self, aws_client: Optional[AwsApiClient] = None) -> Any:
         """Reads the resource from Aws"""
         # Step 1: Use cached value if available
@@ -89,49 +107,92 @@ class AwsResource(ResourceBase):
             return self.active_resource
 
         # Step 2: Skip resource creation if skip_read = True
-        if self.skip_read:
-            print_info(f"Skipping read: {self.get_resource_name()}")
+        if self.skip_action("read"):
             return True
 
         # Step 3: Read resource
         client: AwsApiClient = aws_client or self.get_aws_client()
         return self._read(client)
 
+    async def aread(self, aws_client: Optional[AwsApiClient] = None, service_client: Any = None) -> Any:
+        """Reads the resource from Aws, like read, using an aiobotocore client if the resource supports it"""
+        if self.use_cache and self.active_resource is not None:
+            return self.active_resource
+        if self.skip_action("read"):
+            return True
+        client: AwsApiClient = aws_client or self.get_aws_client()
+        return await self._aread(client, service_client)
+
     def is_active(self, aws_client: AwsApiClient) -> bool:
         """Returns True if the resource is active on Aws"""
         _resource = self.read(aws_client=aws_client)
         return True if _resource is not None else False
 
+    async def ais_active(self, aws_client: AwsApiClient, service_client: Any = None) -> bool:
+        """Returns True if the resource is active on Aws, like is_active"""
+        _resource = await self.aread(aws_client=aws_client, service_client=service_client)
+        return True if _resource is not None else False
+
     def _create(self, aws_client: AwsApiClient) -> bool:
         logger.warning(f"@_create method not defined for {self.get_resource_name()}")
         return True
 
+    async def _acreate(self, aws_client: AwsApiClient, service_client: Any = None) -> bool:
+        """Creates the resource without blocking the event loop, runs _create in a thread unless overridden"""
+        return await run_in_thread(self._create, aws_client)
+
+    def finish_create(self, resource_created: bool, already_exists: bool = False) -> bool:
+        """Records the result of creating the resource. Returns True if the post create steps should run"""
+        self.resource_created = resource_created
+        if not self.resource_created:
+            logger.error(f"Failed to create {self.get_resource_type()}: {self.get_resource_name()}")
+            return False
+        if self.show_progress():
+            if already_exists:
+                print_info(f"{self.get_resource_type()}: {self.get_resource_name()} already exists")
+            else:
+                print_info(f"{self.get_resource_type()}: {self.get_resource_name()} created")
+        if self.save_output:
+            self.save_output_file()
+        logger.debug(f"Running post-create for {self.get_resource_type()}: {self.get_resource_name()}")
+        return True
+
     def create(self, aws_client: Optional[AwsApiClient] = None) -> bool:
         """Creates the resource on Aws"""
 
         # Step 1: Skip resource creation if skip_create = True
-        if self.skip_create:
-            print_info(f"Skipping create: {self.get_resource_name()}")
+        if self.skip_action("create"):
             return True
 
         # Step 2: Check if resource is active and use_cache = True
         client: AwsApiClient = aws_client or self.get_aws_client()
         if self.use_cache and self.is_active(client):
-            self.resource_created = True
-            print_info(f"{self.get_resource_type()}: {self.get_resource_name()} already exists")
+            run_post_create = self.finish_create(True, already_exists=True)
         # Step 3: Create the resource
         else:
-            self.resource_created = self._create(client)
-            if self.resource_created:
-                print_info(f"{self.get_resource_type()}: {self.get_resource_name()} created")
+            run_post_create = self.finish_create(self._create(client))
 
         # Step 4: Run post create steps
-        if self.resource_created:
-            if self.save_output:
-                self.save_output_file()
-            logger.debug(f"Running post-create for {self.get_resource_type()}: {self.get_resource_name()}")
+        if run_post_create:
             return self.post_create(client)
-        logger.error(f"Failed to create {self.get_resource_type()}: {self.get_resource_name()}")
+        return self.resource_created
+
+    async def acreate(self, aws_client: Optional[AwsApiClient] = None, service_client: Any = None) -> bool:
+        """Creates the resource on Aws, like create, using an aiobotocore client if the resource supports it
+
+        post_create is run in a thread, since it may block on a boto3 waiter.
+        """
+        if self.skip_action("create"):
+            return True
+
+        client: AwsApiClient = aws_client or self.get_aws_client()
+        if self.use_cache and await self.ais_active(client, service_client):
+            run_post_create = self.finish_create(True, already_exists=True)
+        else:
+            run_post_create = self.finish_create(await self._acreate(client, service_client))
+
+        if run_post_create:
+            return await run_in_thread(self.post_create, client)
         return self.resource_created
 
     def post_create(self, aws_client: AwsApiClient) -> bool:
@@ -141,30 +202,40 @@ class AwsResource(ResourceBase):
         logger.warning(f"@_update method not defined for {self.get_resource_name()}")
         return True
 
+    def finish_update(self, resource_updated: bool) -> bool:
+        """Records the result of updating the resource. Returns True if the post update steps should run"""
+        self.resource_updated = resource_updated
+        if not self.resource_updated:
+            logger.error(f"Failed to update {self.get_resource_type()}: {self.get_resource_name()}")
+            return False
+        if self.show_progress():
+            if self.resource_up_to_date:
+                print_info(f"{self.get_resource_type()}: {self.get_resource_name()} is up to date")
+            else:
+                print_info(f"{self.get_resource_type()}: {self.get_resource_name()} updated")
+        if self.save_output:
+            self.save_output_file()
+        logger.debug(f"Running post-update for {self.get_resource_type()}: {self.get_resource_name()}")
+        return True
+
     def update(self, aws_client: Optional[AwsApiClient] = None) -> bool:
         """Updates the resource on Aws"""
 
         # Step 1: Skip resource update if skip_update = True
-        if self.skip_update:
-            print_info(f"Skipping update: {self.get_resource_name()}")
+        if self.skip_action("update"):
             return True
 
         # Step 2: Update the resource
         client: AwsApiClient = aws_client or self.get_aws_client()
-        if self.is_active(client):
-            self.resource_updated = self._update(client)
-        else:
-            print_info(f"{self.get_resource_type()}: {self.get_resource_name()} does not exist")
+        if not self.is_active(client):
+            self.print_not_found()
             return True
+        self.resource_up_to_date = False
+        resource_updated = self._update(client)
 
         # Step 3: Run post update steps
-        if self.resource_updated:
-            print_info(f"{self.get_resource_type()}: {self.get_resource_name()} updated")
-            if self.save_output:
-                self.save_output_file()
-            logger.debug(f"Running post-update for {self.get_resource_type()}: {self.get_resource_name()}")
+        if self.finish_update(resource_updated):
             return self.post_update(client)
-        logger.error(f"Failed to update {self.get_resource_type()}: {self.get_resource_name()}")
         return self.resource_updated
 
     def post_update(self, aws_client: AwsApiClient) -> bool:
@@ -174,30 +245,57 @@ class AwsResource(ResourceBase):
         logger.warning(f"@_delete method not defined for {self.get_resource_name()}")
         return True
 
+    async def _adelete(self, aws_client: AwsApiClient, service_client: Any = None) -> Any:
+        """Deletes the resource without blocking the event loop, runs _delete in a thread unless overridden"""
+        return await run_in_thread(self._delete, aws_client)
+
+    def finish_delete(self, resource_deleted: bool) -> bool:
+        """Records the result of deleting the resource. Returns True if the post delete steps should run"""
+        self.resource_deleted = resource_deleted
+        if not self.resource_deleted:
+            logger.error(f"Failed to delete {self.get_resource_type()}: {self.get_resource_name()}")
+            return False
+        if self.show_progress():
+            print_info(f"{self.get_resource_type()}: {self.get_resource_name()} deleted")
+        if self.save_output:
+            self.delete_output_file()
+        logger.debug(f"Running post-delete for {self.get_resource_type()}: {self.get_resource_name()}.")
+        return True
+
     def delete(self, aws_client: Optional[AwsApiClient] = None) -> bool:
         """Deletes the resource from Aws"""
 
         # Step 1: Skip resource deletion if skip_delete = True
-        if self.skip_delete:
-            print_info(f"Skipping delete: {self.get_resource_name()}")
+        if self.skip_action("delete"):
             return True
 
         # Step 2: Delete the resource
         client: AwsApiClient = aws_client or self.get_aws_client()
-        if self.is_active(client):
-            self.resource_deleted = self._delete(client)
-        else:
-            print_info(f"{self.get_resource_type()}: {self.get_resource_name()} does not exist")
+        if not self.is_active(client):
+            self.print_not_found()
             return True
+        resource_deleted = self._delete(client)
 
         # Step 3: Run post delete steps
-        if self.resource_deleted:
-            print_info(f"{self.get_resource_type()}: {self.get_resource_name()} deleted")
-            if self.save_output:
-                self.delete_output_file()
-            logger.debug(f"Running post-delete for {self.get_resource_type()}: {self.get_resource_name()}.")
+        if self.finish_delete(resource_deleted):
             return self.post_delete(client)
-        logger.error(f"Failed to delete {self.get_resource_type()}: {self.get_resource_name()}")
+        return self.resource_deleted
+
+    async def adelete(self, aws_client: Optional[AwsApiClient] = None, service_client: Any = None) -> bool:
+        """Deletes the resource from Aws, like delete, using an aiobotocore client if the resource supports it
+
+        post_delete is run in a thread, since it may block on a boto3 waiter.
+        """
+        if self.skip_action("delete"):
+            return True
+
+        client: AwsApiClient = aws_client or self.get_aws_client()
+        if not await self.ais_active(client, service_client):
+            self.print_not_found()
+            return True
+
+        if self.finish_delete(await self._adelete(client, service_client)):
+            return await run_in_thread(self.post_delete, client)
         return self.resource_deleted
 
     def post_delete(self, aws_client: AwsApiClient) -> bool:
@@ -1,16 +1,105 @@
-from typing import Optional, Any, Dict, List, Union
+import asyncio
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from os import getenv
+from time import monotonic
+from typing import ClassVar, Optional, Any, Dict, List, Tuple, Union
+from uuid import uuid4
 from typing_extensions import Literal
 
-from phi.aws.api_client import AwsApiClient
+from phi.aws.api_client import AwsApiClient, with_async_service_client
 from phi.aws.resource.base import AwsResource
 from phi.aws.resource.ec2.subnet import Subnet
 from phi.aws.resource.ec2.security_group import SecurityGroup
 from phi.aws.resource.ecs.cluster import EcsCluster
-from phi.aws.resource.ecs.task_definition import EcsTaskDefinition
+from phi.aws.resource.ecs.task_definition import EcsTaskDefinition, task_definition_resolver
 from phi.aws.resource.elb.target_group import TargetGroup
 from phi.cli.console import print_info
+from phi.constants import QUIET_ECS_ENV_VAR
+from phi.utils.compare import is_subset
+from phi.utils.concurrency import RateLimiter, RequestBatcher, run_in_thread
 from phi.utils.log import logger
 
+try:
+    from botocore.exceptions import ClientError
+except ImportError:
+    # boto3 is optional, keep this module importable without it. No API call can raise a ClientError then.
+    class ClientError(Exception):  # type: ignore[no-redef]
+        pass
+
+
+# Seconds for which a describe_services result is reused across EcsService objects
+_CACHE_TTL: float = 60.0
+# (aws_region, aws_profile, cluster short name, service_name) -> (cached_at, service)
+_ecs_service_cache: Dict[Tuple[Optional[str], Optional[str], str, str], Tuple[float, Dict[str, Any]]] = {}
+
+
+def get_cluster_short_name(cluster_name: Optional[str]) -> str:
+    """Returns the short name of a cluster given its short name or ARN, or "default" for the default cluster
+
+    Used in cache keys, so the same cluster maps to the same entries however it was specified.
+    """
+    if cluster_name is None:
+        return "default"
+    if cluster_name.startswith("arn:") and ":cluster/" in cluster_name:
+        return cluster_name.split(":cluster/", 1)[1]
+    return cluster_name
+
+
+def index_services_by_name(describe_response: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Returns the services in a describe_services response keyed by service name"""
+    if describe_response is None:
+        return {}
+    resource_list = describe_response.get("services", None)
+    if resource_list is None or not isinstance(resource_list, list):
+        return {}
+    return {r["serviceName"]: r for r in resource_list if isinstance(r, dict) and "serviceName" in r}
+
+
+# Keys dropped from the services kept on EcsService objects and in the describe cache.
+# events alone holds up to 100 messages per service and none of these are used to create, read or update a service.
+_UNUSED_SERVICE_KEYS: Tuple[str, ...] = ("events", "deployments", "taskSets")
+
+
+def compact_service(resource: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the service from describe_services without the keys EcsService does not use"""
+    return {key: value for key, value in resource.items() if key not in _UNUSED_SERVICE_KEYS}
+
+
+# describe_services accepts up to 10 services per call
+_describe_batcher = RequestBatcher(max_batch_size=10, thread_name_prefix="ecs-describe")
+
+
+def describe_service(
+    aws_client: AwsApiClient, service_client: Any, cluster_name: Optional[str], service_name: str
+) -> Future:
+    """Returns a Future which resolves to the service from describe_services, or None if it was not found
+
+    Concurrent calls for services in the same cluster are sent together as one describe_services call.
+    """
+
+    def _describe_services(service_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        # create a dict of args which are not null, otherwise aws type validation fails
+        not_null_args: Dict[str, Any] = {}
+        if cluster_name is not None:
+            not_null_args["cluster"] = cluster_name
+        return index_services_by_name(service_client.describe_services(services=service_names, **not_null_args))
+
+    key = (aws_client.aws_region, aws_client.aws_profile, cluster_name)
+    return _describe_batcher.submit(key, service_name, _describe_services)
+
+
+def print_info_enabled() -> bool:
+    """Returns False if EcsService progress messages are turned off.
+
+    The console serializes output, so messages are skipped when the phi logger is above INFO
+    or PHI_QUIET_ECS is set, e.g. when EcsService.apply_many runs many services at once.
+    """
+    quiet_ecs = getenv(QUIET_ECS_ENV_VAR)
+    if quiet_ecs is not None and quiet_ecs.lower() in ("1", "true", "yes"):
+        return False
+    return logger.isEnabledFor(logging.INFO)
+
 
 class EcsService(AwsResource):
     """
@@ -70,6 +159,8 @@ class EcsService(AwsResource):
     # If schedulingStrategy is DAEMON then this isn't required.
     desired_count: Optional[int] = None
     # An identifier that you provide to ensure the idempotency of the request. It must be unique and is case-sensitive.
+    # If not provided, a new token is generated for each create call so that
+    # boto3 retries of that call cannot create a duplicate service.
     client_token: Optional[str] = None
     # The infrastructure that you run your service on.
     launch_type: Optional[Union[str, Literal["EC2", "FARGATE", "EXTERNAL"]]] = None
@@ -97,9 +188,49 @@ class EcsService(AwsResource):
     # image/tag combination (my_image:latest ) or
     # to roll Fargate tasks onto a newer platform version.
     force_new_deployment: Optional[bool] = None
+    # Deregister the previous task definition revision after the service is updated to a new one.
+    deregister_previous_task_definition: bool = False
 
     wait_for_create: bool = False
 
+    # (attribute, create_service arg) pairs sent when the attribute is not None
+    _create_service_args: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("service_connect_configuration", "serviceConnectConfiguration"),
+        ("service_registries", "serviceRegistries"),
+        ("desired_count", "desiredCount"),
+        ("client_token", "clientToken"),
+        ("launch_type", "launchType"),
+        ("capacity_provider_strategy", "capacityProviderStrategy"),
+        ("platform_version", "platformVersion"),
+        ("role", "role"),
+        ("deployment_configuration", "deploymentConfiguration"),
+        ("placement_constraints", "placementConstraints"),
+        ("placement_strategy", "placementStrategy"),
+        ("health_check_grace_period_seconds", "healthCheckGracePeriodSeconds"),
+        ("scheduling_strategy", "schedulingStrategy"),
+        ("deployment_controller", "deploymentController"),
+        ("tags", "tags"),
+        ("enable_ecsmanaged_tags", "enableECSManagedTags"),
+        ("propagate_tags", "propagateTags"),
+        ("enable_execute_command", "enableExecuteCommand"),
+    )
+    # (attribute, update_service arg) pairs sent when the attribute is not None
+    _update_service_args: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("desired_count", "desiredCount"),
+        ("capacity_provider_strategy", "capacityProviderStrategy"),
+        ("deployment_configuration", "deploymentConfiguration"),
+        ("placement_constraints", "placementConstraints"),
+        ("placement_strategy", "placementStrategy"),
+        ("platform_version", "platformVersion"),
+        ("force_new_deployment", "forceNewDeployment"),
+        ("health_check_grace_period_seconds", "healthCheckGracePeriodSeconds"),
+        ("enable_execute_command", "enableExecuteCommand"),
+        ("enable_ecsmanaged_tags", "enableECSManagedTags"),
+        ("load_balancers", "loadBalancers"),
+        ("propagate_tags", "propagateTags"),
+        ("service_registries", "serviceRegistries"),
+    )
+
     def get_ecs_service_name(self):
         return self.ecs_service_name or self.name
 
@@ -110,26 +241,180 @@ class EcsService(AwsResource):
             else:
                 return self.cluster
 
-    def get_ecs_task_definition(self):
-        if self.task_definition is not None:
-            if isinstance(self.task_definition, EcsTaskDefinition):
-                return self.task_definition.get_task_family()
-            else:
-                return self.task_definition
+    def show_progress(self) -> bool:
+        return print_info_enabled()
+
+    def get_cache_key(self, aws_client: AwsApiClient) -> Tuple[Optional[str], Optional[str], str, str]:
+        # Services with the same name in different accounts or regions must not share cache entries
+        return (
+            aws_client.aws_region,
+            aws_client.aws_profile,
+            get_cluster_short_name(self.get_ecs_cluster_name()),
+            self.get_ecs_service_name(),
+        )
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Clear the cached describe_services results for all EcsServices"""
+        _ecs_service_cache.clear()
+
+    @classmethod
+    def apply_many(
+        cls,
+        items: List["EcsService"],
+        aws_client: AwsApiClient,
+        action: Literal["create", "update", "delete"] = "create",
+        max_workers: int = 10,
+        max_rate: float = 20.0,
+    ) -> List[bool]:
+        """Creates, updates or deletes EcsServices concurrently
 
-    def _create(self, aws_client: AwsApiClient) -> bool:
-        """Create EcsService"""
-        print_info(f"Creating {self.get_resource_type()}: {self.get_resource_name()}")
+        Args:
+            items: The EcsServices to apply the action to
+            aws_client: The AwsApiClient shared by all workers
+            action: The lifecycle method to run on each EcsService
+            max_workers: Maximum number of EcsServices processed at the same time
+            max_rate: Maximum number of EcsServices started per second, to stay within ECS API quotas
+
+        Returns:
+            The result for each EcsService, in the same order as items.
+            The first exception raised by a worker is re-raised.
+        """
+        if action not in ("create", "update", "delete"):
+            raise ValueError(f"Invalid action: {action}")
+
+        rate_limiter = RateLimiter(max_rate)
+
+        def _apply(item: "EcsService") -> bool:
+            rate_limiter.wait()
+            return getattr(item, action)(aws_client)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_apply, item) for item in items]
+        return [future.result() for future in futures]
+
+    @classmethod
+    async def apply_many_async(
+        cls,
+        items: List["EcsService"],
+        aws_client: AwsApiClient,
+        action: Literal["create", "delete"] = "create",
+        max_concurrency: int = 10,
+    ) -> List[bool]:
+        """Creates or deletes EcsServices concurrently using one aiobotocore client
+
+        Runs AwsResource.acreate or AwsResource.adelete for each EcsService, which follow the same steps
+        as create and delete, including skip_create/skip_delete, use_cache and the post_create/post_delete waiters.
+        Updates are not supported, use apply_many instead.
+
+        Args:
+            items: The EcsServices to apply the action to
+            aws_client: The AwsApiClient for the current cluster
+            action: The lifecycle method to run on each EcsService
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            The result for each EcsService, in the same order as items.
+        """
+        if action not in ("create", "delete"):
+            raise ValueError(f"Invalid action: {action}")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        async with aws_client.get_async_service_client("ecs") as service_client:
+
+            async def _apply(item: "EcsService") -> bool:
+                async with semaphore:
+                    if action == "create":
+                        return await item.acreate(aws_client, service_client)
+                    return await item.adelete(aws_client, service_client)
+
+            return list(await asyncio.gather(*[_apply(item) for item in items]))
+
+    @classmethod
+    def list_all(
+        cls,
+        aws_client: AwsApiClient,
+        cluster: Optional[Union[EcsCluster, str]] = None,
+        max_workers: int = 10,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Returns all services in a cluster, keyed by service name
+
+        Uses paginated list_services calls and concurrent describe_services calls for 10 services at a time,
+        instead of one describe_services call per service. The results are cached,
+        so reading these services with _read does not call the API again.
+        Errors are logged, and services in a describe_services call which failed are left out.
+
+        Args:
+            aws_client: The AwsApiClient for the current cluster
+            cluster: The EcsCluster, or its name or ARN. Uses the default cluster if not provided.
+            max_workers: Maximum number of describe_services calls in flight
+        """
+        cluster_name: Optional[str] = cluster.get_ecs_cluster_name() if isinstance(cluster, EcsCluster) else cluster
 
         # create a dict of args which are not null, otherwise aws type validation fails
         not_null_args: Dict[str, Any] = {}
-
-        cluster_name = self.get_ecs_cluster_name()
         if cluster_name is not None:
             not_null_args["cluster"] = cluster_name
 
-        network_configuration = self.network_configuration
-        if network_configuration is None and (self.subnets is not None or self.security_groups is not None):
+        service_client = aws_client.get_service_client("ecs")
+        service_arns: List[str] = []
+        try:
+            for page in service_client.get_paginator("list_services").paginate(**not_null_args):
+                service_arns.extend(page.get("serviceArns", []))
+        except ClientError as ce:
+            logger.debug("ClientError: %s", ce)
+            return {}
+        except Exception as e:
+            logger.error("Error listing EcsServices.")
+            logger.error(e)
+            return {}
+
+        def _describe(arns: List[str]) -> List[Dict[str, Any]]:
+            try:
+                describe_response = service_client.describe_services(services=arns, **not_null_args)
+                logger.debug("EcsService: %s", describe_response)
+                return describe_response.get("services", [])
+            except ClientError as ce:
+                logger.debug("ClientError: %s", ce)
+            except Exception as e:
+                logger.error("Error reading EcsServices.")
+                logger.error(e)
+            return []
+
+        cluster_key = get_cluster_short_name(cluster_name)
+        chunks = [service_arns[i : i + 10] for i in range(0, len(service_arns), 10)]
+        services: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for resource_list in executor.map(_describe, chunks):
+                for resource in resource_list:
+                    service_name = resource.get("serviceName", None)
+                    if service_name is None:
+                        continue
+                    resource = compact_service(resource)
+                    services[service_name] = resource
+                    if resource.get("status", None) == "ACTIVE":
+                        cache_key = (aws_client.aws_region, aws_client.aws_profile, cluster_key, service_name)
+                        _ecs_service_cache[cache_key] = (monotonic(), resource)
+        return services
+
+    def get_ecs_task_definition(self):
+        if self.task_definition is not None:
+            if isinstance(self.task_definition, EcsTaskDefinition):
+                return self.task_definition.get_task_family()
+            else:
+                return self.task_definition
+
+    def get_resolved_task_definition(self, aws_client: AwsApiClient) -> Optional[Dict[str, Any]]:
+        """Returns the task definition used by this service, as returned by describe_task_definition"""
+        task_definition = self.get_ecs_task_definition()
+        if task_definition is None:
+            return None
+        resolved = task_definition_resolver.resolve_many(self.get_service_client(aws_client), [task_definition])
+        return resolved.get(task_definition, None)
+
+    def get_network_configuration(self, aws_client: AwsApiClient) -> Optional[Dict[str, Any]]:
+        """Returns the networkConfiguration, built from subnets and security_groups if not provided"""
+        if self.network_configuration is None and (self.subnets is not None or self.security_groups is not None):
             aws_vpc_config: Dict[str, Any] = {}
             if self.subnets is not None:
                 subnet_ids = []
@@ -149,47 +434,26 @@ class EcsService(AwsResource):
                 aws_vpc_config["securityGroups"] = security_group_ids
             if self.assign_public_ip:
                 aws_vpc_config["assignPublicIp"] = "ENABLED"
-            network_configuration = {"awsvpcConfiguration": aws_vpc_config}
+            return {"awsvpcConfiguration": aws_vpc_config}
+        return self.network_configuration
+
+    def get_create_service_args(self, aws_client: AwsApiClient) -> Dict[str, Any]:
+        """Returns the args for create_service"""
+        # create a dict of args which are not null, otherwise aws type validation fails
+        not_null_args: Dict[str, Any] = {}
+
+        cluster_name = self.get_ecs_cluster_name()
+        if cluster_name is not None:
+            not_null_args["cluster"] = cluster_name
+
+        network_configuration = self.get_network_configuration(aws_client)
         if network_configuration is not None:
             not_null_args["networkConfiguration"] = network_configuration
 
-        if self.service_connect_configuration is not None:
-            not_null_args["serviceConnectConfiguration"] = self.service_connect_configuration
-
-        if self.service_registries is not None:
-            not_null_args["serviceRegistries"] = self.service_registries
-        if self.desired_count is not None:
-            not_null_args["desiredCount"] = self.desired_count
-        if self.client_token is not None:
-            not_null_args["clientToken"] = self.client_token
-        if self.launch_type is not None:
-            not_null_args["launchType"] = self.launch_type
-        if self.capacity_provider_strategy is not None:
-            not_null_args["capacityProviderStrategy"] = self.capacity_provider_strategy
-        if self.platform_version is not None:
-            not_null_args["platformVersion"] = self.platform_version
-        if self.role is not None:
-            not_null_args["role"] = self.role
-        if self.deployment_configuration is not None:
-            not_null_args["deploymentConfiguration"] = self.deployment_configuration
-        if self.placement_constraints is not None:
-            not_null_args["placementConstraints"] = self.placement_constraints
-        if self.placement_strategy is not None:
-            not_null_args["placementStrategy"] = self.placement_strategy
-        if self.health_check_grace_period_seconds is not None:
-            not_null_args["healthCheckGracePeriodSeconds"] = self.health_check_grace_period_seconds
-        if self.scheduling_strategy is not None:
-            not_null_args["schedulingStrategy"] = self.scheduling_strategy
-        if self.deployment_controller is not None:
-            not_null_args["deploymentController"] = self.deployment_controller
-        if self.tags is not None:
-            not_null_args["tags"] = self.tags
-        if self.enable_ecsmanaged_tags is not None:
-            not_null_args["enableECSManagedTags"] = self.enable_ecsmanaged_tags
-        if self.propagate_tags is not None:
-            not_null_args["propagateTags"] = self.propagate_tags
-        if self.enable_execute_command is not None:
-            not_null_args["enableExecuteCommand"] = self.enable_execute_command
+        for attr, api_key in self._create_service_args:
+            value = getattr(self, attr)
+            if value is not None:
+                not_null_args[api_key] = value
 
         if self.load_balancers is not None:
             not_null_args["loadBalancers"] = self.load_balancers
@@ -202,20 +466,64 @@ class EcsService(AwsResource):
                 }
             ]
 
+        # Generate a client token so boto3 retries of this request are idempotent
+        if "clientToken" not in not_null_args:
+            not_null_args["clientToken"] = uuid4().hex
+
+        return {
+            "serviceName": self.get_ecs_service_name(),
+            "taskDefinition": self.get_ecs_task_definition(),
+            **not_null_args,
+        }
+
+    def _create(self, aws_client: AwsApiClient) -> bool:
+        """Create EcsService"""
+        if print_info_enabled():
+            print_info(f"Creating {self.get_resource_type()}: {self.get_resource_name()}")
+
+        create_service_args = self.get_create_service_args(aws_client)
+
         # Register EcsService
+        _ecs_service_cache.pop(self.get_cache_key(aws_client), None)
         service_client = self.get_service_client(aws_client)
         try:
-            create_response = service_client.create_service(
-                serviceName=self.get_ecs_service_name(),
-                taskDefinition=self.get_ecs_task_definition(),
-                **not_null_args,
-            )
-            logger.debug(f"EcsService: {create_response}")
-            resource_dict = create_response.get("service", {})
+            create_response = service_client.create_service(**create_service_args)
+            logger.debug("EcsService: %s", create_response)
+            resource_dict = (create_response or {}).get("service", None)
 
             # Validate resource creation
-            if resource_dict is not None:
-                self.active_resource = create_response
+            if resource_dict and resource_dict.get("serviceArn", None):
+                self.active_resource = compact_service(resource_dict)
+                # create_service returns the full service, so the next _read can use it without describing
+                if resource_dict.get("status", None) == "ACTIVE":
+                    _ecs_service_cache[self.get_cache_key(aws_client)] = (monotonic(), self.active_resource)
+                return True
+        except Exception as e:
+            logger.error(f"{self.get_resource_type()} could not be created.")
+            logger.error(e)
+        return False
+
+    @with_async_service_client
+    async def _acreate(self, aws_client: AwsApiClient, service_client: Any = None) -> bool:
+        """Create EcsService using an aiobotocore client"""
+        if print_info_enabled():
+            print_info(f"Creating {self.get_resource_type()}: {self.get_resource_name()}")
+
+        # The target group and security groups are looked up using blocking boto3 calls
+        create_service_args = await run_in_thread(self.get_create_service_args, aws_client)
+
+        # Register EcsService
+        _ecs_service_cache.pop(self.get_cache_key(aws_client), None)
+        try:
+            create_response = await service_client.create_service(**create_service_args)
+            logger.debug("EcsService: %s", create_response)
+            resource_dict = (create_response or {}).get("service", None)
+
+            # Validate resource creation
+            if resource_dict and resource_dict.get("serviceArn", None):
+                self.active_resource = compact_service(resource_dict)
+                if resource_dict.get("status", None) == "ACTIVE":
+                    _ecs_service_cache[self.get_cache_key(aws_client)] = (monotonic(), self.active_resource)
                 return True
         except Exception as e:
             logger.error(f"{self.get_resource_type()} could not be created.")
@@ -225,31 +533,106 @@ class EcsService(AwsResource):
     def post_create(self, aws_client: AwsApiClient) -> bool:
         # Wait for EcsService to be created
         if self.wait_for_create:
-            try:
-                cluster_name = self.get_ecs_cluster_name()
-                if cluster_name is not None:
-                    print_info(f"Waiting for {self.get_resource_type()} to be available.")
-                    waiter = self.get_service_client(aws_client).get_waiter("services_stable")
-                    waiter.wait(
-                        cluster=cluster_name,
-                        services=[self.get_ecs_service_name()],
-                        WaiterConfig={
-                            "Delay": self.waiter_delay,
-                            "MaxAttempts": self.waiter_max_attempts,
-                        },
-                    )
-                else:
-                    logger.warning("Skipping waiter, no Service found")
-            except Exception as e:
-                logger.error("Waiter failed.")
-                logger.error(e)
+            if print_info_enabled():
+                print_info(f"Waiting for {self.get_resource_type()} to be available.")
+            self.wait_for_service(aws_client, "services_stable")
         return True
 
-    def _read(self, aws_client: AwsApiClient) -> Optional[Any]:
-        """Read EcsService"""
-        from botocore.exceptions import ClientError
+    def wait_for_service(self, aws_client: AwsApiClient, waiter_name: str) -> bool:
+        """Block until the EcsService reaches the state checked by the boto3 waiter
+
+        The waiter batches the DescribeServices polling with its own backoff,
+        so callers should use it instead of looping over _read.
+
+        Args:
+            aws_client: The AwsApiClient for the current cluster
+            waiter_name: One of "services_stable" or "services_inactive"
+        """
+        cluster_name = self.get_ecs_cluster_name()
+        if cluster_name is None:
+            logger.warning("Skipping waiter, no Service found")
+            return False
+        try:
+            waiter = self.get_service_client(aws_client).get_waiter(waiter_name)
+            waiter.wait(
+                cluster=cluster_name,
+                services=[self.get_ecs_service_name()],
+                WaiterConfig={
+                    "Delay": self.waiter_delay,
+                    "MaxAttempts": self.waiter_max_attempts,
+                },
+            )
+            return True
+        except Exception as e:
+            logger.error("Waiter failed.")
+            logger.error(e)
+        return False
+
+    def get_active_service(self, describe_response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Returns this service from a describe_services response if it is ACTIVE"""
+        resource = index_services_by_name(describe_response).get(self.get_ecs_service_name(), None)
+        if resource is not None and resource.get("status", None) == "ACTIVE":
+            return resource
+        return None
+
+    def get_cached_service(self, aws_client: AwsApiClient) -> Optional[Dict[str, Any]]:
+        """Returns this service if it was described recently"""
+        cache_key = self.get_cache_key(aws_client)
+        cached = _ecs_service_cache.get(cache_key)
+        if cached is not None:
+            cached_at, cached_resource = cached
+            if monotonic() - cached_at < _CACHE_TTL and cached_resource.get("status", None) == "ACTIVE":
+                return cached_resource
+            _ecs_service_cache.pop(cache_key, None)
+        return None
+
+    def _read(self, aws_client: AwsApiClient, wait: bool = False) -> Optional[Any]:
+        """Read EcsService
+
+        Args:
+            aws_client: The AwsApiClient for the current cluster
+            wait: If True, wait for the EcsService to be stable before reading it
+        """
+        logger.debug("Reading %s: %s", self.get_resource_type(), self.get_resource_name())
+        if wait:
+            self.wait_for_service(aws_client, "services_stable")
+
+        # Use the cached service if it was described recently
+        cache_key = self.get_cache_key(aws_client)
+        if not wait:
+            cached_resource = self.get_cached_service(aws_client)
+            if cached_resource is not None:
+                self.active_resource = cached_resource
+                return self.active_resource
+
+        service_client = self.get_service_client(aws_client)
+        try:
+            service_name: str = self.get_ecs_service_name()
+            # Batched with concurrent reads of other services in the same cluster.
+            # No timeout: the call is bounded by the retries and timeouts of the ECS client, and a timeout here
+            # would make a throttled read look like a service that does not exist.
+            resource = describe_service(aws_client, service_client, self.get_ecs_cluster_name(), service_name).result()
+            logger.debug("EcsService: %s", resource)
+            if resource is not None and resource.get("status", None) == "ACTIVE":
+                resource = compact_service(resource)
+                self.active_resource = resource
+                _ecs_service_cache[cache_key] = (monotonic(), resource)
+        except ClientError as ce:
+            logger.debug("ClientError: %s", ce)
+        except Exception as e:
+            logger.error(f"Error reading {self.get_resource_type()}.")
+            logger.error(e)
+        return self.active_resource
+
+    @with_async_service_client
+    async def _aread(self, aws_client: AwsApiClient, service_client: Any = None) -> Optional[Any]:
+        """Read EcsService using an aiobotocore client"""
+        logger.debug("Reading %s: %s", self.get_resource_type(), self.get_resource_name())
 
-        logger.debug(f"Reading {self.get_resource_type()}: {self.get_resource_name()}")
+        cached_resource = self.get_cached_service(aws_client)
+        if cached_resource is not None:
+            self.active_resource = cached_resource
+            return self.active_resource
 
         # create a dict of args which are not null, otherwise aws type validation fails
         not_null_args: Dict[str, Any] = {}
@@ -258,32 +641,25 @@ class EcsService(AwsResource):
         if cluster_name is not None:
             not_null_args["cluster"] = cluster_name
 
-        service_client = self.get_service_client(aws_client)
         try:
-            service_name: str = self.get_ecs_service_name()
-            describe_response = service_client.describe_services(services=[service_name], **not_null_args)
-            logger.debug(f"EcsService: {describe_response}")
-            resource_list = describe_response.get("services", None)
-
-            if resource_list is not None and isinstance(resource_list, list):
-                for resource in resource_list:
-                    _service_name: str = resource.get("serviceName", None)
-                    if _service_name == service_name:
-                        _service_status = resource.get("status", None)
-                        if _service_status == "ACTIVE":
-                            self.active_resource = resource
-                            break
+            describe_response = await service_client.describe_services(
+                services=[self.get_ecs_service_name()], **not_null_args
+            )
+            logger.debug("EcsService: %s", describe_response)
+            resource = self.get_active_service(describe_response)
+            if resource is not None:
+                resource = compact_service(resource)
+                self.active_resource = resource
+                _ecs_service_cache[self.get_cache_key(aws_client)] = (monotonic(), resource)
         except ClientError as ce:
-            logger.debug(f"ClientError: {ce}")
+            logger.debug("ClientError: %s", ce)
         except Exception as e:
             logger.error(f"Error reading {self.get_resource_type()}.")
             logger.error(e)
         return self.active_resource
 
-    def _delete(self, aws_client: AwsApiClient) -> bool:
-        """Delete EcsService"""
-        print_info(f"Deleting {self.get_resource_type()}: {self.get_resource_name()}")
-
+    def get_delete_service_args(self) -> Dict[str, Any]:
+        """Returns the args for delete_service"""
         # create a dict of args which are not null, otherwise aws type validation fails
         not_null_args: Dict[str, Any] = {}
 
@@ -293,14 +669,37 @@ class EcsService(AwsResource):
         if self.force_delete is not None:
             not_null_args["force"] = self.force_delete
 
+        return {"service": self.get_ecs_service_name(), **not_null_args}
+
+    def _delete(self, aws_client: AwsApiClient) -> bool:
+        """Delete EcsService"""
+        if print_info_enabled():
+            print_info(f"Deleting {self.get_resource_type()}: {self.get_resource_name()}")
+
         service_client = self.get_service_client(aws_client)
         self.active_resource = None
+        _ecs_service_cache.pop(self.get_cache_key(aws_client), None)
         try:
-            delete_response = service_client.delete_service(
-                service=self.get_ecs_service_name(),
-                **not_null_args,
-            )
-            logger.debug(f"EcsService: {delete_response}")
+            delete_response = service_client.delete_service(**self.get_delete_service_args())
+            logger.debug("EcsService: %s", delete_response)
+            return True
+        except Exception as e:
+            logger.error(f"{self.get_resource_type()} could not be deleted.")
+            logger.error("Please try again or delete resources manually.")
+            logger.error(e)
+        return False
+
+    @with_async_service_client
+    async def _adelete(self, aws_client: AwsApiClient, service_client: Any = None) -> bool:
+        """Delete EcsService using an aiobotocore client"""
+        if print_info_enabled():
+            print_info(f"Deleting {self.get_resource_type()}: {self.get_resource_name()}")
+
+        self.active_resource = None
+        _ecs_service_cache.pop(self.get_cache_key(aws_client), None)
+        try:
+            delete_response = await service_client.delete_service(**self.get_delete_service_args())
+            logger.debug("EcsService: %s", delete_response)
             return True
         except Exception as e:
             logger.error(f"{self.get_resource_type()} could not be deleted.")
@@ -311,34 +710,78 @@ class EcsService(AwsResource):
     def post_delete(self, aws_client: AwsApiClient) -> bool:
         # Wait for EcsService to be deleted
         if self.wait_for_delete:
-            try:
-                cluster_name = self.get_ecs_cluster_name()
-                if cluster_name is not None:
-                    print_info(f"Waiting for {self.get_resource_type()} to be deleted.")
-                    waiter = self.get_service_client(aws_client).get_waiter("services_inactive")
-                    waiter.wait(
-                        cluster=cluster_name,
-                        services=[self.get_ecs_service_name()],
-                        WaiterConfig={
-                            "Delay": self.waiter_delay,
-                            "MaxAttempts": self.waiter_max_attempts,
-                        },
-                    )
-                else:
-                    logger.warning("Skipping waiter, no Service found")
-            except Exception as e:
-                logger.error("Waiter failed.")
-                logger.error(e)
+            if print_info_enabled():
+                print_info(f"Waiting for {self.get_resource_type()} to be deleted.")
+            self.wait_for_service(aws_client, "services_inactive")
         return True
 
+    def get_update_service_args(self, aws_client: AwsApiClient, service: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns the update_service args which differ from the deployed service
+
+        Args:
+            aws_client: The AwsApiClient for the current cluster
+            service: The deployed service, as returned by describe_services
+        """
+        # create a dict of args which are not null, otherwise aws type validation fails
+        not_null_args: Dict[str, Any] = {}
+
+        task_definition = self.get_ecs_task_definition()
+        if task_definition is not None:
+            # Compare using the ARN of the revision the task definition resolves to
+            resolved_task_definition = self.get_resolved_task_definition(aws_client)
+            if resolved_task_definition is not None:
+                task_definition = resolved_task_definition.get("taskDefinitionArn", task_definition)
+            not_null_args["taskDefinition"] = task_definition
+
+        network_configuration = self.get_network_configuration(aws_client)
+        if network_configuration is not None:
+            not_null_args["networkConfiguration"] = network_configuration
+
+        for attr, api_key in self._update_service_args:
+            value = getattr(self, attr)
+            if value is not None:
+                not_null_args[api_key] = value
+
+        changed_args: Dict[str, Any] = {}
+        for api_key, value in not_null_args.items():
+            if api_key == "forceNewDeployment":
+                if value:
+                    changed_args[api_key] = value
+                continue
+            desired = value
+            if api_key == "networkConfiguration" and "awsvpcConfiguration" in value:
+                # assignPublicIp is DISABLED on the deployed service when not provided
+                desired = {"awsvpcConfiguration": {"assignPublicIp": "DISABLED", **value["awsvpcConfiguration"]}}
+            if not is_subset(desired, service.get(api_key, None)):
+                logger.debug("%s: %s -> %s", api_key, service.get(api_key, None), value)
+                changed_args[api_key] = value
+        return changed_args
+
     def _update(self, aws_client: AwsApiClient) -> bool:
         """Updates the EcsService
 
+        Only the args which differ from the deployed service are sent to update_service,
+        and no call is made if nothing changed.
+
         Args:
             aws_client: The AwsApiClient for the current cluster
         """
 
-        print_info(f"Updating {self.get_resource_type()}: {self.get_resource_name()}")
+        if print_info_enabled():
+            print_info(f"Updating {self.get_resource_type()}: {self.get_resource_name()}")
+
+        # Read the deployed service, served from the describe cache when possible
+        self.active_resource = None
+        service = self._read(aws_client)
+        if service is None:
+            logger.error(f"{self.get_resource_type()}: {self.get_resource_name()} not found")
+            return False
+
+        changed_args = self.get_update_service_args(aws_client, service)
+        if len(changed_args) == 0:
+            # update reports the service as up to date instead of updated
+            self.resource_up_to_date = True
+            return True
 
         # create a dict of args which are not null, otherwise aws type validation fails
         not_null_args: Dict[str, Any] = {}
@@ -347,74 +790,44 @@ class EcsService(AwsResource):
         if cluster_name is not None:
             not_null_args["cluster"] = cluster_name
 
-        network_configuration = self.network_configuration
-        if network_configuration is None and (self.subnets is not None or self.security_groups is not None):
-            aws_vpc_config: Dict[str, Any] = {}
-            if self.subnets is not None:
-                subnet_ids = []
-                for subnet in self.subnets:
-                    if isinstance(subnet, Subnet):
-                        subnet_ids.append(subnet.name)
-                    elif isinstance(subnet, str):
-                        subnet_ids.append(subnet)
-                aws_vpc_config["subnets"] = subnet_ids
-            if self.security_groups is not None:
-                security_group_ids = []
-                for sg in self.security_groups:
-                    if isinstance(sg, SecurityGroup):
-                        security_group_ids.append(sg.get_security_group_id(aws_client))
-                    else:
-                        security_group_ids.append(sg)
-                aws_vpc_config["securityGroups"] = security_group_ids
-            if self.assign_public_ip:
-                aws_vpc_config["assignPublicIp"] = "ENABLED"
-            network_configuration = {"awsvpcConfiguration": aws_vpc_config}
-        if self.network_configuration is not None:
-            not_null_args["networkConfiguration"] = network_configuration
-
-        if self.desired_count is not None:
-            not_null_args["desiredCount"] = self.desired_count
-        if self.capacity_provider_strategy is not None:
-            not_null_args["capacityProviderStrategy"] = self.capacity_provider_strategy
-        if self.deployment_configuration is not None:
-            not_null_args["deploymentConfiguration"] = self.deployment_configuration
-        if self.placement_constraints is not None:
-            not_null_args["placementConstraints"] = self.placement_constraints
-        if self.placement_strategy is not None:
-            not_null_args["placementStrategy"] = self.placement_strategy
-        if self.platform_version is not None:
-            not_null_args["platformVersion"] = self.platform_version
-        if self.force_new_deployment is not None:
-            not_null_args["forceNewDeployment"] = self.force_new_deployment
-        if self.health_check_grace_period_seconds is not None:
-            not_null_args["healthCheckGracePeriodSeconds"] = self.health_check_grace_period_seconds
-        if self.enable_execute_command is not None:
-            not_null_args["enableExecuteCommand"] = self.enable_execute_command
-        if self.enable_ecsmanaged_tags is not None:
-            not_null_args["enableECSManagedTags"] = self.enable_ecsmanaged_tags
-        if self.load_balancers is not None:
-            not_null_args["loadBalancers"] = self.load_balancers
-        if self.propagate_tags is not None:
-            not_null_args["propagateTags"] = self.propagate_tags
-        if self.service_registries is not None:
-            not_null_args["serviceRegistries"] = self.service_registries
-
+        _ecs_service_cache.pop(self.get_cache_key(aws_client), None)
         try:
             # Update EcsService
             service_client = self.get_service_client(aws_client)
             update_response = service_client.update_service(
                 service=self.get_ecs_service_name(),
-                taskDefinition=self.get_ecs_task_definition(),
+                **changed_args,
                 **not_null_args,
             )
-            logger.debug(f"update_response: {update_response}")
-
-            self.active_resource = update_response.get("service", None)
-            if self.active_resource is not None:
-                print_info(f"{self.get_resource_type()}: {self.get_resource_name()} updated")
+            logger.debug("update_response: %s", update_response)
+
+            updated_service = (update_response or {}).get("service", None)
+            if updated_service is not None:
+                self.active_resource = compact_service(updated_service)
+                if print_info_enabled():
+                    print_info(f"{self.get_resource_type()}: {self.get_resource_name()} updated")
+                previous_task_definition = service.get("taskDefinition", None)
+                if (
+                    self.deregister_previous_task_definition
+                    and "taskDefinition" in changed_args
+                    and previous_task_definition is not None
+                ):
+                    self.deregister_task_definition(aws_client, previous_task_definition)
                 return True
         except Exception as e:
             logger.error(f"{self.get_resource_type()} could not be updated.")
             logger.error("Please try again or update resources manually.")
             logger.error(e)
         return False
+
+    def deregister_task_definition(self, aws_client: AwsApiClient, task_definition: str) -> bool:
+        """Deregisters a task definition revision which is no longer used by this service"""
+        logger.debug("Deregistering TaskDefinition: %s", task_definition)
+        try:
+            service_client = self.get_service_client(aws_client)
+            service_client.deregister_task_definition(taskDefinition=task_definition)
+            return True
+        except Exception as e:
+            logger.warning(f"TaskDefinition {task_definition} could not be deregistered.")
+            logger.warning(e)
+        return False
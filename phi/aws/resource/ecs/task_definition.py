@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from textwrap import dedent
+from threading import Lock
 from typing import Optional, Any, Dict, List
 from typing_extensions import Literal
 
@@ -12,6 +14,83 @@ from phi.cli.console import print_info
 from phi.utils.log import logger
 
 
+class TaskDefinitionResolver:
+    """Describes many task definitions with concurrent describe_task_definition calls.
+
+    A task definition revision is immutable, so described revisions are cached by ARN and family:revision
+    for the life of the process. A family without a revision resolves to its latest ACTIVE revision
+    and is described every time, so the cache only saves calls for pinned revisions.
+    """
+
+    def __init__(self, max_workers: int = 10):
+        # Maximum number of describe_task_definition calls in flight
+        self.max_workers: int = max_workers
+
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._lock = Lock()
+        # Created on the first call which describes more than one task definition
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def is_revision(task_definition: str) -> bool:
+        """Returns True if task_definition is a family:revision or an ARN with a revision"""
+        return ":" in task_definition.rsplit("/", 1)[-1]
+
+    def resolve_many(self, service_client: Any, task_definitions: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Returns the task definition for each family, family:revision or ARN in task_definitions.
+
+        Task definitions which could not be described are left out of the result.
+        """
+        from botocore.exceptions import ClientError
+
+        resolved: Dict[str, Dict[str, Any]] = {}
+        to_describe: List[str] = []
+        with self._lock:
+            for task_definition in dict.fromkeys(task_definitions):
+                if self.is_revision(task_definition) and task_definition in self._cache:
+                    resolved[task_definition] = self._cache[task_definition]
+                else:
+                    to_describe.append(task_definition)
+        if len(to_describe) == 0:
+            return resolved
+
+        def _describe(task_definition: str) -> Optional[Dict[str, Any]]:
+            try:
+                describe_response = service_client.describe_task_definition(taskDefinition=task_definition)
+                return describe_response.get("taskDefinition", None)
+            except ClientError as ce:
+                logger.debug(f"ClientError: {ce}")
+            except Exception as e:
+                logger.error(f"Error reading TaskDefinition: {task_definition}")
+                logger.error(e)
+            return None
+
+        if len(to_describe) == 1:
+            results = [_describe(to_describe[0])]
+        else:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="ecs-task-definition"
+                    )
+                executor = self._executor
+            results = list(executor.map(_describe, to_describe))
+
+        with self._lock:
+            for task_definition, resource in zip(to_describe, results):
+                if resource is None:
+                    continue
+                resolved[task_definition] = resource
+                if "taskDefinitionArn" in resource:
+                    self._cache[resource["taskDefinitionArn"]] = resource
+                if "family" in resource and "revision" in resource:
+                    self._cache[f"{resource['family']}:{resource['revision']}"] = resource
+        return resolved
+
+
+task_definition_resolver = TaskDefinitionResolver()
+
+
 class EcsTaskDefinition(AwsResource):
     """
     Reference:
@@ -18,6 +18,7 @@ AWS_DEFAULT_REGION_ENV_VAR: str = "AWS_DEFAULT_REGION"
 AWS_PROFILE_ENV_VAR: str = "AWS_PROFILE"
 AWS_CONFIG_FILE_ENV_VAR: str = "AWS_CONFIG_FILE"
 AWS_SHARED_CREDENTIALS_FILE_ENV_VAR: str = "AWS_SHARED_CREDENTIALS_FILE"
+QUIET_ECS_ENV_VAR: str = "PHI_QUIET_ECS"
 
 INIT_AIRFLOW_ENV_VAR: str = "INIT_AIRFLOW"
 AIRFLOW_ENV_ENV_VAR: str = "AIRFLOW_ENV"
@@ -0,0 +1,21 @@
+from typing import Any
+
+
+def is_subset(desired: Any, actual: Any) -> bool:
+    """Returns True if every value in desired matches the value at the same place in actual
+
+    Only keys present in desired are compared, so actual may contain more keys, e.g. defaults filled in by an API.
+    Lists of strings, like subnets and security groups, are compared without order.
+    Other lists are compared in order.
+    """
+    if isinstance(desired, dict):
+        if not isinstance(actual, dict):
+            return False
+        return all(is_subset(value, actual.get(key, None)) for key, value in desired.items())
+    if isinstance(desired, list):
+        if not isinstance(actual, list) or len(desired) != len(actual):
+            return False
+        if all(isinstance(value, str) for value in desired):
+            return sorted(desired) == sorted(actual)
+        return all(is_subset(d, a) for d, a in zip(desired, actual))
+    return desired == actual
@@ -0,0 +1,136 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class RateLimiter:
+    """Spaces out calls so that at most `rate` calls start per second"""
+
+    def __init__(self, rate: float):
+        self._interval: float = 1.0 / rate if rate > 0 else 0.0
+        self._next_call: float = 0.0
+        self._lock = Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            call_at = max(monotonic(), self._next_call)
+            self._next_call = call_at + self._interval
+        delay = call_at - monotonic()
+        if delay > 0:
+            sleep(delay)
+
+
+class RequestBatcher:
+    """Coalesces concurrent requests with the same key into batched calls.
+
+    While a call for a key is in flight, new requests for that key are queued and sent together once it returns,
+    so N concurrent requests cost ceil(N/max_batch_size) calls instead of N.
+
+    Calls are sent from a small dedicated executor, so a caller only waits for its own batch
+    and not for the requests queued by other callers after it.
+    """
+
+    def __init__(
+        self, max_batch_size: int = 10, max_delay: float = 0.0, max_workers: int = 4, thread_name_prefix: str = ""
+    ):
+        # Maximum number of items per call
+        self.max_batch_size: int = max_batch_size
+        # Seconds to wait for more requests before sending a batch that is not full.
+        # Serial callers pay this on every request, so it defaults to 0.
+        self.max_delay: float = max_delay
+        # Maximum number of keys sent at the same time
+        self.max_workers: int = max_workers
+        self.thread_name_prefix: str = thread_name_prefix
+
+        self._lock = Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # key -> [(item, future)]
+        self._pending: Dict[Hashable, List[Tuple[Hashable, Future]]] = {}
+        self._in_flight: Set[Hashable] = set()
+
+    def submit(self, key: Hashable, item: Hashable, send: Callable[[List[Any]], Dict[Any, Any]]) -> Future:
+        """Queues item and returns a Future which resolves to its result, or None if send returned no result for it
+
+        Args:
+            key: Requests with the same key are sent together
+            item: The item to send
+            send: Called with up to max_batch_size distinct items for the key, returns the result for each item.
+                If a call for the key is already in flight, the send of the request which started it is used.
+        """
+        future: Future = Future()
+        with self._lock:
+            self._pending.setdefault(key, []).append((item, future))
+            if key in self._in_flight:
+                # The flush running for this key will pick this request up
+                return future
+            self._in_flight.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=self.thread_name_prefix
+                )
+            executor = self._executor
+
+        try:
+            executor.submit(self._flush, key, send)
+        except Exception:
+            # e.g. the executor is shut down at interpreter exit, fail the queued requests instead of leaving them
+            self._fail_pending(key, RuntimeError("Could not send batched request"))
+            raise
+        return future
+
+    def _fail_pending(self, key: Hashable, error: BaseException) -> None:
+        """Stops flushing the key and fails the requests which are still queued for it"""
+        with self._lock:
+            self._in_flight.discard(key)
+            pending = self._pending.pop(key, [])
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(error)
+
+    def _flush(self, key: Hashable, send: Callable[[List[Any]], Dict[Any, Any]]) -> None:
+        batch: List[Tuple[Hashable, Future]] = []
+        drained = False
+        try:
+            while True:
+                with self._lock:
+                    if not self._pending.get(key):
+                        self._pending.pop(key, None)
+                        self._in_flight.discard(key)
+                        drained = True
+                        return
+                    batch_full = len(self._pending[key]) >= self.max_batch_size
+                if self.max_delay > 0 and not batch_full:
+                    sleep(self.max_delay)
+
+                with self._lock:
+                    pending = self._pending[key]
+                    batch = pending[: self.max_batch_size]
+                    self._pending[key] = pending[self.max_batch_size :]
+
+                try:
+                    results = send(list(dict.fromkeys(item for item, _ in batch)))
+                    for item, future in batch:
+                        future.set_result(results.get(item, None))
+                except Exception as e:
+                    for _, future in batch:
+                        future.set_exception(e)
+        finally:
+            if not drained:
+                # The loop exited early, e.g. on KeyboardInterrupt. Release the key and fail the open requests,
+                # so later requests do not queue behind a flush that is no longer running.
+                error = RuntimeError("Batched request was interrupted")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                self._fail_pending(key, error)
+
+
+async def run_in_thread(func: Callable[..., T], *args: Any) -> T:
+    """Runs a blocking call, like a boto3 waiter, in the default executor so it does not block the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(func, *args))
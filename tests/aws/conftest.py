@@ -0,0 +1,16 @@
+import pytest
+
+from phi.aws.api_client import AwsApiClient
+from phi.aws.resource.ecs.service import EcsService
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    EcsService.invalidate_cache()
+    yield
+    EcsService.invalidate_cache()
+
+
+@pytest.fixture
+def aws_client() -> AwsApiClient:
+    return AwsApiClient(aws_region="us-east-1", aws_profile="prod")
@@ -0,0 +1,78 @@
+from typing import Any, Dict, List, Optional
+
+
+# Default FakeEcsClient.create_response, creates the service
+CREATE_SERVICE = object()
+
+
+class FakeEcsClient:
+    """Records the ECS API calls made by EcsService and returns canned responses"""
+
+    def __init__(self, services: List[Dict[str, Any]], task_definitions: Optional[List[Dict[str, Any]]] = None):
+        self.services = {s["serviceName"]: s for s in services}
+        self.task_definitions = task_definitions or []
+        self.calls: List[Any] = []
+        # Returned by create_service instead of the created service if set
+        self.create_response: Any = CREATE_SERVICE
+
+    def describe_services(self, services: List[str], **kwargs) -> Dict[str, Any]:
+        self.calls.append(("describe_services", list(services)))
+        # services may be names or ARNs
+        names = [service.rsplit("/", 1)[-1] for service in services]
+        return {"services": [self.services[name] for name in names if name in self.services]}
+
+    def get_paginator(self, operation_name: str) -> "FakePaginator":
+        return FakePaginator(self, operation_name)
+
+    def describe_task_definition(self, taskDefinition: str) -> Dict[str, Any]:
+        self.calls.append(("describe_task_definition", taskDefinition))
+        family = taskDefinition.rsplit("/", 1)[-1].split(":")[0]
+        matching = [t for t in self.task_definitions if t["family"] == family]
+        return {"taskDefinition": max(matching, key=lambda t: t["revision"])}
+
+    def create_service(self, **kwargs) -> Dict[str, Any]:
+        self.calls.append(("create_service", kwargs))
+        if self.create_response is not CREATE_SERVICE:
+            return self.create_response
+        service = deployed_service(kwargs["serviceName"], events=[{"message": "has started 1 tasks"}])
+        self.services[kwargs["serviceName"]] = service
+        return {"service": service}
+
+    def delete_service(self, **kwargs) -> Dict[str, Any]:
+        self.calls.append(("delete_service", kwargs))
+        return {"service": {**self.services.pop(kwargs["service"]), "status": "DRAINING"}}
+
+    def update_service(self, **kwargs) -> Dict[str, Any]:
+        self.calls.append(("update_service", kwargs))
+        return {"service": {**self.services[kwargs["service"]], "status": "ACTIVE"}}
+
+
+def deployed_service(name: str, **kwargs) -> Dict[str, Any]:
+    return {
+        "serviceName": name,
+        "serviceArn": f"arn:aws:ecs:us-east-1:123456789012:service/prod/{name}",
+        "status": "ACTIVE",
+        "taskDefinition": f"arn:aws:ecs:us-east-1:123456789012:task-definition/{name}:2",
+        "desiredCount": 1,
+        "networkConfiguration": {
+            "awsvpcConfiguration": {
+                "subnets": ["subnet-a", "subnet-b"],
+                "securityGroups": ["sg-a"],
+                "assignPublicIp": "DISABLED",
+            }
+        },
+        **kwargs,
+    }
+
+
+class FakePaginator:
+    """Returns the services of a FakeEcsClient in pages of 10 ARNs, like the list_services paginator"""
+
+    def __init__(self, client: FakeEcsClient, operation_name: str):
+        assert operation_name == "list_services"
+        self.client = client
+
+    def paginate(self, **kwargs) -> List[Dict[str, Any]]:
+        self.client.calls.append(("list_services", kwargs))
+        arns = [service["serviceArn"] for service in self.client.services.values()]
+        return [{"serviceArns": arns[i : i + 10]} for i in range(0, len(arns), 10)] or [{"serviceArns": []}]
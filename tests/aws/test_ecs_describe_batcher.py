@@ -0,0 +1,63 @@
+from threading import Event
+from typing import Any, Dict, List
+
+import pytest
+
+from phi.aws.resource.ecs.service import describe_service
+from tests.aws.ecs_fakes import FakeEcsClient, deployed_service
+
+
+class BlockingEcsClient(FakeEcsClient):
+    """Holds describe_services calls until released, so requests queue up behind the call in flight"""
+
+    def __init__(self, services: List[Dict[str, Any]]):
+        super().__init__(services)
+        self.in_flight = Event()
+        self.release = Event()
+
+    def describe_services(self, services: List[str], **kwargs) -> Dict[str, Any]:
+        self.in_flight.set()
+        self.release.wait(5)
+        return super().describe_services(services, **kwargs)
+
+
+def test_describe_service_batches_concurrent_requests(aws_client):
+    names = [f"svc-{i}" for i in range(12)]
+    fake_client = BlockingEcsClient([deployed_service(name) for name in names])
+
+    # The first request is sent right away, describe_service returns without waiting for it
+    first = describe_service(aws_client, fake_client, "prod", names[0])
+    assert fake_client.in_flight.wait(5) and not first.done()
+    # Requests made while it is in flight are queued and sent together
+    rest = [describe_service(aws_client, fake_client, "prod", name) for name in names[1:]]
+    fake_client.release.set()
+
+    assert first.result(timeout=5)["serviceName"] == names[0]
+    assert [future.result(timeout=5)["serviceName"] for future in rest] == names[1:]
+    assert [len(services) for _, services in fake_client.calls] == [1, 10, 1]
+
+
+def test_describe_service_releases_cluster_after_error(aws_client):
+    class FailingClient(FakeEcsClient):
+        def describe_services(self, services: List[str], **kwargs) -> Dict[str, Any]:
+            raise RuntimeError("throttled")
+
+    with pytest.raises(RuntimeError):
+        describe_service(aws_client, FailingClient([]), "prod", "web").result(timeout=5)
+
+    # The cluster is not left in flight, so the next request is sent
+    fake_client = FakeEcsClient([deployed_service("web")])
+    assert describe_service(aws_client, fake_client, "prod", "web").result(timeout=5)["serviceName"] == "web"
+
+
+def test_describe_service_deduplicates_and_resolves_missing_services(aws_client):
+    fake_client = BlockingEcsClient([deployed_service("web")])
+
+    first = describe_service(aws_client, fake_client, "prod", "other")
+    assert fake_client.in_flight.wait(5)
+    queued = [describe_service(aws_client, fake_client, "prod", name) for name in ("web", "web", "missing")]
+    fake_client.release.set()
+
+    assert first.result(timeout=5) is None
+    assert [f.result(timeout=5) and f.result()["serviceName"] for f in queued] == ["web", "web", None]
+    assert fake_client.calls == [("describe_services", ["other"]), ("describe_services", ["web", "missing"])]
@@ -0,0 +1,85 @@
+from typing import List
+
+import pytest
+
+pytest.importorskip("botocore")
+
+from phi.aws.resource.ecs.service import EcsService  # noqa: E402
+from phi.utils.compare import is_subset  # noqa: E402
+from tests.aws.ecs_fakes import FakeEcsClient, deployed_service  # noqa: E402
+
+
+def test_is_subset():
+    deployed = {"desiredCount": 1, "subnets": ["b", "a"], "defaults": {"filled": "by ecs"}}
+    assert is_subset({"desiredCount": 1}, deployed)
+    assert is_subset({"subnets": ["a", "b"]}, deployed)
+    assert not is_subset({"subnets": ["a"]}, deployed)
+    assert not is_subset({"desiredCount": 2}, deployed)
+    assert not is_subset({"missing": 1}, deployed)
+    # Lists of objects, like load balancers, are compared in order
+    assert is_subset([{"port": 80}, {"port": 443}], [{"port": 80, "name": "a"}, {"port": 443}])
+    assert not is_subset([{"port": 443}, {"port": 80}], [{"port": 80}, {"port": 443}])
+
+
+def test_get_update_service_args_network_configuration(aws_client):
+    service = deployed_service("web-network")
+    # assignPublicIp defaults to DISABLED and subnets are compared without order
+    unchanged = EcsService(
+        name="web-network", cluster="prod", subnets=["subnet-b", "subnet-a"], security_groups=["sg-a"]
+    )
+    assert unchanged.get_update_service_args(aws_client, service) == {}
+
+    changed = EcsService(name="web-network", cluster="prod", subnets=["subnet-a", "subnet-c"], security_groups=["sg-a"])
+    assert changed.get_update_service_args(aws_client, service) == {
+        "networkConfiguration": {
+            "awsvpcConfiguration": {"subnets": ["subnet-a", "subnet-c"], "securityGroups": ["sg-a"]}
+        }
+    }
+
+    public = EcsService(
+        name="web-network",
+        cluster="prod",
+        subnets=["subnet-a", "subnet-b"],
+        security_groups=["sg-a"],
+        assign_public_ip=True,
+    )
+    assert "networkConfiguration" in public.get_update_service_args(aws_client, service)
+
+
+def test_get_update_service_args_task_definition(aws_client):
+    arn = "arn:aws:ecs:us-east-1:123456789012:task-definition/web-td:{}"
+    task_definitions = [
+        {"family": "web-td", "revision": 2, "taskDefinitionArn": arn.format(2)},
+        {"family": "web-td", "revision": 3, "taskDefinitionArn": arn.format(3)},
+    ]
+    fake_client = FakeEcsClient([], task_definitions)
+    ecs = EcsService(name="web-td", cluster="prod", task_definition="web-td", service_client=fake_client)
+
+    # The family resolves to the ARN of its latest revision, which is compared with the deployed ARN
+    assert ecs.get_update_service_args(aws_client, deployed_service("web-td", taskDefinition=arn.format(3))) == {}
+    assert ecs.get_update_service_args(aws_client, deployed_service("web-td", taskDefinition=arn.format(2))) == {
+        "taskDefinition": arn.format(3)
+    }
+
+    ecs.force_new_deployment = True
+    args = ecs.get_update_service_args(aws_client, deployed_service("web-td", taskDefinition=arn.format(3)))
+    assert args == {"forceNewDeployment": True}
+
+
+def test_update_up_to_date(aws_client, monkeypatch):
+    messages: List[str] = []
+    monkeypatch.setattr("phi.aws.resource.base.print_info", messages.append)
+    fake_client = FakeEcsClient([deployed_service("web-update")])
+    ecs = EcsService(name="web-update", cluster="prod", desired_count=1, service_client=fake_client)
+
+    assert ecs.update(aws_client)
+    assert ecs.resource_up_to_date
+    assert messages == ["Service: web-update is up to date"]
+    assert [call[0] for call in fake_client.calls] == ["describe_services"]
+
+    messages.clear()
+    ecs.desired_count = 2
+    assert ecs.update(aws_client)
+    assert not ecs.resource_up_to_date
+    assert messages == ["Service: web-update updated"]
+    assert fake_client.calls[-1] == ("update_service", {"service": "web-update", "desiredCount": 2, "cluster": "prod"})
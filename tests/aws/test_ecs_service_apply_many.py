@@ -0,0 +1,59 @@
+from random import random
+from threading import Lock
+from time import sleep
+from typing import List, Optional
+
+import pytest
+
+from phi.aws.api_client import AwsApiClient
+from phi.aws.resource.ecs.service import EcsService
+from phi.utils.concurrency import RateLimiter
+
+
+class RecordingEcsService(EcsService):
+    """EcsService whose lifecycle methods finish in random order and record which ran"""
+
+    def create(self, aws_client: Optional[AwsApiClient] = None) -> bool:
+        sleep(random() / 100)
+        if self.name == "error":
+            raise RuntimeError(f"could not create {self.name}")
+        return self.name != "failed"
+
+    def delete(self, aws_client: Optional[AwsApiClient] = None) -> bool:
+        return True
+
+
+def test_apply_many_returns_results_in_order(aws_client):
+    names = [f"svc-{i}" for i in range(20)] + ["failed"]
+    items = [RecordingEcsService(name=name) for name in names]
+
+    results = EcsService.apply_many(items, aws_client, action="create", max_workers=5, max_rate=0)
+    assert results == [name != "failed" for name in names]
+    assert EcsService.apply_many(items, aws_client, action="delete", max_rate=0) == [True] * len(items)
+
+
+def test_apply_many_reraises_worker_exceptions(aws_client):
+    items = [RecordingEcsService(name=name) for name in ("a", "error", "b")]
+    with pytest.raises(RuntimeError, match="could not create error"):
+        EcsService.apply_many(items, aws_client, action="create", max_rate=0)
+
+
+def test_apply_many_rejects_unknown_actions(aws_client):
+    with pytest.raises(ValueError):
+        EcsService.apply_many([], aws_client, action="read")  # type: ignore[arg-type]
+
+
+def test_rate_limiter_spaces_out_calls(monkeypatch):
+    sleeps: List[float] = []
+    lock = Lock()
+
+    def fake_sleep(seconds: float) -> None:
+        with lock:
+            sleeps.append(seconds)
+
+    monkeypatch.setattr("phi.utils.concurrency.monotonic", lambda: 10.0)
+    monkeypatch.setattr("phi.utils.concurrency.sleep", fake_sleep)
+    rate_limiter = RateLimiter(rate=4)
+    for _ in range(3):
+        rate_limiter.wait()
+    assert sleeps == [0.25, 0.5]
@@ -0,0 +1,84 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+
+from phi.aws.api_client import AwsApiClient
+from phi.aws.resource.ecs.service import EcsService
+from phi.constants import QUIET_ECS_ENV_VAR
+from tests.aws.ecs_fakes import FakeEcsClient, deployed_service
+
+
+class FakeAsyncEcsClient:
+    """Async wrapper around FakeEcsClient, standing in for an aiobotocore ECS client"""
+
+    def __init__(self, client: FakeEcsClient):
+        self.client = client
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self.client, name)
+
+        async def _call(**kwargs) -> Dict[str, Any]:
+            return method(**kwargs)
+
+        return _call
+
+
+class FakeAsyncAwsApiClient(AwsApiClient):
+    def __init__(self, client: FakeEcsClient):
+        super().__init__(aws_region="us-east-1", aws_profile="prod")
+        self.client = client
+
+    @asynccontextmanager
+    async def get_async_service_client(self, service_name: str) -> AsyncIterator[Any]:
+        yield FakeAsyncEcsClient(self.client)
+
+
+@pytest.fixture
+def messages(monkeypatch) -> List[str]:
+    printed: List[str] = []
+    monkeypatch.setattr("phi.aws.resource.base.print_info", printed.append)
+    monkeypatch.setattr("phi.aws.resource.ecs.service.print_info", printed.append)
+    return printed
+
+
+def test_apply_many_async_create(messages):
+    fake_client = FakeEcsClient([deployed_service("exists")])
+    items = [
+        EcsService(name="exists", cluster="prod", task_definition="web"),
+        EcsService(name="new", cluster="prod", task_definition="web"),
+        EcsService(name="skipped", cluster="prod", skip_create=True),
+    ]
+
+    results = asyncio.run(EcsService.apply_many_async(items, FakeAsyncAwsApiClient(fake_client), action="create"))
+    assert results == [True, True, True]
+    assert [item.resource_created for item in items] == [True, True, False]
+    assert [call[0] for call in fake_client.calls] == ["describe_services", "describe_services", "create_service"]
+    assert "Service: exists already exists" in messages
+    assert "Service: new created" in messages
+    assert "Skipping create: skipped" in messages
+
+
+def test_apply_many_async_delete_runs_post_delete(messages, monkeypatch):
+    waited: List[str] = []
+    monkeypatch.setattr(EcsService, "wait_for_service", lambda self, aws_client, waiter_name: waited.append(self.name))
+    fake_client = FakeEcsClient([deployed_service("exists")])
+    items = [EcsService(name="exists", cluster="prod"), EcsService(name="missing", cluster="prod")]
+
+    results = asyncio.run(EcsService.apply_many_async(items, FakeAsyncAwsApiClient(fake_client), action="delete"))
+    assert results == [True, True]
+    assert [item.resource_deleted for item in items] == [True, False]
+    assert waited == ["exists"]
+    assert "Service: missing does not exist" in messages
+
+
+def test_async_progress_can_be_turned_off(messages, monkeypatch):
+    monkeypatch.setenv(QUIET_ECS_ENV_VAR, "1")
+    fake_client = FakeEcsClient([])
+    items = [EcsService(name="new", cluster="prod", task_definition="web"), EcsService(name="gone", cluster="prod")]
+
+    aws_client = FakeAsyncAwsApiClient(fake_client)
+    asyncio.run(EcsService.apply_many_async(items[:1], aws_client, action="create"))
+    asyncio.run(EcsService.apply_many_async(items[1:], aws_client, action="delete"))
+    assert messages == []
@@ -0,0 +1,64 @@
+import pytest
+
+from phi.aws.api_client import AwsApiClient
+from phi.aws.resource.ecs import service as ecs_service
+from phi.aws.resource.ecs.service import EcsService
+from tests.aws.ecs_fakes import FakeEcsClient, deployed_service
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(ecs_service, "monotonic", lambda: clock[0])
+    return clock
+
+
+def test_read_is_cached_across_objects(aws_client, now):
+    fake_client = FakeEcsClient([deployed_service("web")])
+
+    resource = EcsService(name="web", cluster="prod", service_client=fake_client)._read(aws_client)
+    assert resource is not None and resource["serviceName"] == "web"
+    assert EcsService(name="web", cluster="prod", service_client=fake_client)._read(aws_client) == resource
+    assert len(fake_client.calls) == 1
+
+
+def test_cache_is_keyed_by_region_and_profile(aws_client, now):
+    fake_client = FakeEcsClient([deployed_service("web")])
+    EcsService(name="web", cluster="prod", service_client=fake_client)._read(aws_client)
+
+    for other_client in (
+        AwsApiClient(aws_region="us-east-1", aws_profile="dev"),
+        AwsApiClient(aws_region="eu-west-1", aws_profile="prod"),
+    ):
+        EcsService(name="web", cluster="prod", service_client=fake_client)._read(other_client)
+    assert len(fake_client.calls) == 3
+
+
+def test_cache_expires_after_ttl(aws_client, now):
+    fake_client = FakeEcsClient([deployed_service("web")])
+    EcsService(name="web", cluster="prod", service_client=fake_client)._read(aws_client)
+
+    now[0] += ecs_service._CACHE_TTL - 1
+    EcsService(name="web", cluster="prod", service_client=fake_client)._read(aws_client)
+    assert len(fake_client.calls) == 1
+
+    now[0] += 1
+    EcsService(name="web", cluster="prod", service_client=fake_client)._read(aws_client)
+    assert len(fake_client.calls) == 2
+
+
+def test_invalidate_cache(aws_client, now):
+    fake_client = FakeEcsClient([deployed_service("web")])
+    EcsService(name="web", cluster="prod", service_client=fake_client)._read(aws_client)
+
+    EcsService.invalidate_cache()
+    EcsService(name="web", cluster="prod", service_client=fake_client)._read(aws_client)
+    assert len(fake_client.calls) == 2
+
+
+def test_inactive_services_are_not_cached(aws_client, now):
+    fake_client = FakeEcsClient([deployed_service("web", status="INACTIVE")])
+
+    assert EcsService(name="web", cluster="prod", service_client=fake_client)._read(aws_client) is None
+    assert EcsService(name="web", cluster="prod", service_client=fake_client)._read(aws_client) is None
+    assert len(fake_client.calls) == 2
@@ -0,0 +1,62 @@
+import pytest
+
+from phi.aws.resource.ecs.service import EcsService, index_services_by_name
+from tests.aws.ecs_fakes import FakeEcsClient
+
+
+def test_create_generates_client_token(aws_client):
+    fake_client = FakeEcsClient([])
+    ecs = EcsService(name="web", cluster="prod", task_definition="web", service_client=fake_client)
+
+    assert ecs._create(aws_client)
+    assert ecs._create(aws_client)
+    tokens = [call[1]["clientToken"] for call in fake_client.calls if call[0] == "create_service"]
+    # A new token per create call, so only boto3 retries of the same call share a token
+    assert len(tokens) == 2 and tokens[0] != tokens[1]
+    assert all(len(token) == 32 for token in tokens)
+
+
+def test_create_uses_client_token(aws_client):
+    ecs = EcsService(name="web", cluster="prod", task_definition="web", client_token="my-token")
+    assert ecs.get_create_service_args(aws_client)["clientToken"] == "my-token"
+
+
+def test_create_seeds_the_describe_cache(aws_client):
+    fake_client = FakeEcsClient([])
+    EcsService(name="web", cluster="prod", task_definition="web", service_client=fake_client)._create(aws_client)
+
+    # The next read of the service uses the create_service response instead of describing it
+    resource = EcsService(name="web", cluster="prod", service_client=fake_client)._read(aws_client)
+    assert resource is not None and resource["serviceName"] == "web"
+    assert [call[0] for call in fake_client.calls] == ["create_service"]
+
+
+def test_create_does_not_cache_inactive_services(aws_client):
+    fake_client = FakeEcsClient([])
+    fake_client.create_response = {"service": {"serviceName": "web", "serviceArn": "arn:web", "status": "DRAINING"}}
+    assert EcsService(name="web", cluster="prod", task_definition="web", service_client=fake_client)._create(aws_client)
+
+    EcsService(name="web", cluster="prod", service_client=fake_client)._read(aws_client)
+    assert [call[0] for call in fake_client.calls] == ["create_service", "describe_services"]
+
+
+@pytest.mark.parametrize(
+    "create_response",
+    [None, {}, {"service": None}, {"service": {"serviceName": "web", "status": "ACTIVE"}}],
+)
+def test_create_fails_without_a_created_service(aws_client, create_response):
+    fake_client = FakeEcsClient([])
+    fake_client.create_response = create_response
+    ecs = EcsService(name="web", cluster="prod", task_definition="web", service_client=fake_client)
+
+    assert not ecs._create(aws_client)
+    assert ecs.active_resource is None
+    assert ecs.get_cached_service(aws_client) is None
+
+
+@pytest.mark.parametrize(
+    "describe_response",
+    [None, {}, {"services": None}, {"services": [None, {"status": "ACTIVE"}]}],
+)
+def test_index_services_by_name_skips_malformed_responses(describe_response):
+    assert index_services_by_name(describe_response) == {}
@@ -0,0 +1,62 @@
+from typing import Any, Dict, List
+
+from phi.aws.resource.ecs.cluster import EcsCluster
+from phi.aws.resource.ecs.service import EcsService
+from tests.aws.ecs_fakes import FakeEcsClient, deployed_service
+
+CLUSTER_ARN = "arn:aws:ecs:us-east-1:123456789012:cluster/prod"
+
+
+def fake_aws_client(aws_client, fake_client: FakeEcsClient):
+    aws_client._service_clients["ecs"] = fake_client
+    return aws_client
+
+
+def test_list_all_pages_and_chunks(aws_client):
+    names = [f"svc-{i}" for i in range(23)]
+    fake_client = FakeEcsClient([deployed_service(name) for name in names])
+
+    services = EcsService.list_all(fake_aws_client(aws_client, fake_client), cluster="prod", max_workers=2)
+    assert sorted(services) == sorted(names)
+    assert all("events" not in service for service in services.values())
+    assert fake_client.calls[0] == ("list_services", {"cluster": "prod"})
+    assert sorted(len(call[1]) for call in fake_client.calls[1:]) == [3, 10, 10]
+
+
+def test_list_all_seeds_the_cache(aws_client):
+    fake_client = FakeEcsClient([deployed_service("web"), deployed_service("old", status="INACTIVE")])
+    fake_aws_client(aws_client, fake_client)
+
+    services = EcsService.list_all(aws_client, cluster=CLUSTER_ARN)
+    assert sorted(services) == ["old", "web"]
+    fake_client.calls.clear()
+
+    # The cluster ARN, short name and EcsCluster all use the same cache entries
+    for cluster in (CLUSTER_ARN, "prod", EcsCluster(name="prod")):
+        assert EcsService(name="web", cluster=cluster, service_client=fake_client)._read(aws_client) is not None
+    assert fake_client.calls == []
+    # Only ACTIVE services are cached
+    EcsService(name="old", cluster="prod", service_client=fake_client)._read(aws_client)
+    assert fake_client.calls == [("describe_services", ["old"])]
+
+
+def test_list_all_skips_chunks_which_fail(aws_client):
+    class FlakyClient(FakeEcsClient):
+        def describe_services(self, services: List[str], **kwargs) -> Dict[str, Any]:
+            if any(service.endswith("svc-0") for service in services):
+                raise RuntimeError("throttled")
+            return super().describe_services(services, **kwargs)
+
+    names = [f"svc-{i}" for i in range(12)]
+    fake_client = FlakyClient([deployed_service(name) for name in names])
+
+    services = EcsService.list_all(fake_aws_client(aws_client, fake_client), cluster="prod")
+    assert sorted(services) == ["svc-10", "svc-11"]
+
+
+def test_list_all_returns_nothing_if_listing_fails(aws_client):
+    class FailingClient(FakeEcsClient):
+        def get_paginator(self, operation_name: str) -> Any:
+            raise RuntimeError("access denied")
+
+    assert EcsService.list_all(fake_aws_client(aws_client, FailingClient([])), cluster="prod") == {}
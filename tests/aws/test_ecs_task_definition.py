@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip("botocore")
+
+from phi.aws.resource.ecs.task_definition import TaskDefinitionResolver  # noqa: E402
+from tests.aws.ecs_fakes import FakeEcsClient  # noqa: E402
+
+ARN = "arn:aws:ecs:us-east-1:123456789012:task-definition/web:{}"
+TASK_DEFINITIONS = [
+    {"family": "web", "revision": 2, "taskDefinitionArn": ARN.format(2)},
+    {"family": "web", "revision": 3, "taskDefinitionArn": ARN.format(3)},
+    {"family": "worker", "revision": 1, "taskDefinitionArn": ARN.replace("web", "worker").format(1)},
+]
+
+
+def test_is_revision():
+    assert TaskDefinitionResolver.is_revision("web:3")
+    assert TaskDefinitionResolver.is_revision(ARN.format(3))
+    assert not TaskDefinitionResolver.is_revision("web")
+    assert not TaskDefinitionResolver.is_revision("arn:aws:ecs:us-east-1:123456789012:task-definition/web")
+
+
+def test_revisions_are_cached_by_arn_and_family_revision():
+    fake_client = FakeEcsClient([], TASK_DEFINITIONS)
+    resolver = TaskDefinitionResolver()
+
+    resolved = resolver.resolve_many(fake_client, ["web"])
+    assert resolved["web"]["taskDefinitionArn"] == ARN.format(3)
+    # The revision the family resolved to is cached under both names
+    assert resolver.resolve_many(fake_client, [ARN.format(3), "web:3"]) == {
+        ARN.format(3): resolved["web"],
+        "web:3": resolved["web"],
+    }
+    assert len(fake_client.calls) == 1
+
+
+def test_families_are_described_every_time():
+    fake_client = FakeEcsClient([], TASK_DEFINITIONS)
+    resolver = TaskDefinitionResolver()
+
+    resolver.resolve_many(fake_client, ["web"])
+    resolver.resolve_many(fake_client, ["web"])
+    assert fake_client.calls == [("describe_task_definition", "web")] * 2
+
+
+def test_single_lookup_does_not_start_an_executor():
+    resolver = TaskDefinitionResolver()
+    resolver.resolve_many(FakeEcsClient([], TASK_DEFINITIONS), ["web"])
+    assert resolver._executor is None
+
+
+def test_many_lookups_are_described_concurrently():
+    fake_client = FakeEcsClient([], TASK_DEFINITIONS)
+    resolver = TaskDefinitionResolver()
+
+    resolved = resolver.resolve_many(fake_client, ["web", "worker", "web", "missing"])
+    assert sorted(resolved) == ["web", "worker"]
+    assert sorted(call[1] for call in fake_client.calls) == ["missing", "web", "worker"]
+    assert resolver._executor is not None